@@ -16,17 +16,17 @@ async function migrate() {
   console.log("🚀 Starting database migration for subscription tables...");
 
   try {
-    // Add new fields to users table
+    // Send all DDL in a single round trip. Without bind parameters the driver
+    // uses the simple-query protocol, so Postgres runs the statements back to
+    // back as one implicit transaction.
     await db.execute(`
+      -- Add new fields to users table
       ALTER TABLE users 
       ADD COLUMN IF NOT EXISTS first_name TEXT,
       ADD COLUMN IF NOT EXISTS last_name TEXT,
       ADD COLUMN IF NOT EXISTS stripe_customer_id TEXT UNIQUE;
-    `);
-    console.log("✅ Updated users table with new fields");
 
-    // Create subscription_plans table
-    await db.execute(`
+      -- Create subscription_plans table
       CREATE TABLE IF NOT EXISTS subscription_plans (
         id VARCHAR PRIMARY KEY DEFAULT gen_random_uuid(),
         name TEXT NOT NULL UNIQUE,
@@ -46,11 +46,8 @@ async function migrate() {
         created_at TIMESTAMP DEFAULT NOW(),
         updated_at TIMESTAMP DEFAULT NOW()
       );
-    `);
-    console.log("✅ Created subscription_plans table");
 
-    // Create user_subscriptions table
-    await db.execute(`
+      -- Create user_subscriptions table
       CREATE TABLE IF NOT EXISTS user_subscriptions (
         id VARCHAR PRIMARY KEY DEFAULT gen_random_uuid(),
         user_id VARCHAR NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -71,11 +68,10 @@ async function migrate() {
         created_at TIMESTAMP DEFAULT NOW(),
         updated_at TIMESTAMP DEFAULT NOW()
       );
-    `);
-    console.log("✅ Created user_subscriptions table");
+      CREATE INDEX IF NOT EXISTS idx_user_subscriptions_user_status_created
+        ON user_subscriptions (user_id, status, created_at DESC);
 
-    // Create usage_tracking table
-    await db.execute(`
+      -- Create usage_tracking table
       CREATE TABLE IF NOT EXISTS usage_tracking (
         id VARCHAR PRIMARY KEY DEFAULT gen_random_uuid(),
         user_id VARCHAR NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -93,11 +89,11 @@ async function migrate() {
         created_at TIMESTAMP DEFAULT NOW(),
         updated_at TIMESTAMP DEFAULT NOW()
       );
-    `);
-    console.log("✅ Created usage_tracking table");
+      -- Databases with the earlier non-unique index: run db:migrate:usage-tracking
+      CREATE UNIQUE INDEX IF NOT EXISTS idx_usage_tracking_user_metric_period
+        ON usage_tracking (user_id, metric_type, period, period_start);
 
-    // Create billing_history table
-    await db.execute(`
+      -- Create billing_history table
       CREATE TABLE IF NOT EXISTS billing_history (
         id VARCHAR PRIMARY KEY DEFAULT gen_random_uuid(),
         user_id VARCHAR NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -124,11 +120,8 @@ async function migrate() {
         created_at TIMESTAMP DEFAULT NOW(),
         updated_at TIMESTAMP DEFAULT NOW()
       );
-    `);
-    console.log("✅ Created billing_history table");
 
-    // Create payment_methods table
-    await db.execute(`
+      -- Create payment_methods table
       CREATE TABLE IF NOT EXISTS payment_methods (
         id VARCHAR PRIMARY KEY DEFAULT gen_random_uuid(),
         user_id VARCHAR NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -147,7 +140,7 @@ async function migrate() {
         updated_at TIMESTAMP DEFAULT NOW()
       );
     `);
-    console.log("✅ Created payment_methods table");
+    console.log("✅ Updated users table and created subscription, usage and billing tables");
 
     // Insert default subscription plans
     await db.execute(`
@@ -0,0 +1,59 @@
+import { neonConfig, Pool } from '@neondatabase/serverless';
+import ws from 'ws';
+
+// Must run before `npm run db:push` on databases created before
+// idx_usage_tracking_user_metric_period became unique: push cannot build the
+// unique index while duplicate counter rows exist, and incrementUsage's
+// ON CONFLICT upsert fails until it does.
+async function main() {
+  try {
+    const url = process.env.DATABASE_URL;
+    if (!url) {
+      console.error('DATABASE_URL is not set');
+      process.exit(1);
+    }
+    neonConfig.webSocketConstructor = ws as unknown as any;
+    const pool = new Pool({ connectionString: url });
+
+    // Collapse duplicate counters for the same period into the newest row,
+    // summing their values, then enforce one row per user, metric and period.
+    // Sent as one simple query, so it runs as a single implicit transaction.
+    await pool.query(`
+      WITH ranked AS (
+        SELECT id,
+          ROW_NUMBER() OVER w AS rn,
+          SUM(metric_value) OVER (PARTITION BY user_id, metric_type, period, period_start) AS total
+        FROM usage_tracking
+        WINDOW w AS (PARTITION BY user_id, metric_type, period, period_start ORDER BY created_at DESC, id)
+      )
+      UPDATE usage_tracking u SET metric_value = ranked.total
+      FROM ranked WHERE u.id = ranked.id AND ranked.rn = 1;
+      DELETE FROM usage_tracking u
+      USING (
+        SELECT id, ROW_NUMBER() OVER (
+          PARTITION BY user_id, metric_type, period, period_start ORDER BY created_at DESC, id
+        ) AS rn
+        FROM usage_tracking
+      ) ranked
+      WHERE u.id = ranked.id AND ranked.rn > 1;
+      DROP INDEX IF EXISTS idx_usage_tracking_user_metric_period;
+      CREATE UNIQUE INDEX idx_usage_tracking_user_metric_period
+        ON usage_tracking (user_id, metric_type, period, period_start);
+    `);
+
+    // Verify
+    const check = await pool.query(`SELECT indexdef FROM pg_indexes WHERE indexname='idx_usage_tracking_user_metric_period'`);
+    if (check.rowCount && check.rows[0].indexdef.startsWith('CREATE UNIQUE INDEX')) {
+      console.log('OK: usage_tracking counters deduplicated and unique index present');
+      process.exit(0);
+    } else {
+      console.error('FAILED: unique idx_usage_tracking_user_metric_period missing');
+      process.exit(2);
+    }
+  } catch (err: any) {
+    console.error('Migration error:', err?.message || err);
+    process.exit(1);
+  }
+}
+
+main();
@@ -11,5 +11,14 @@ if (!process.env.DATABASE_URL) {
   );
 }
 
-export const pool = new Pool({ connectionString: process.env.DATABASE_URL });
+export const pool = new Pool({
+  connectionString: process.env.DATABASE_URL,
+  // Size for concurrent request load and keep idle connections around long
+  // enough that bursts reuse them instead of reconnecting (TLS + auth)
+  max: parseInt(process.env.DB_POOL_MAX || '20', 10),
+  idleTimeoutMillis: parseInt(process.env.DB_POOL_IDLE_TIMEOUT_MS || '60000', 10),
+  connectionTimeoutMillis: parseInt(process.env.DB_POOL_CONNECT_TIMEOUT_MS || '10000', 10),
+  // Recycle connections periodically so per-backend memory doesn't grow unbounded
+  maxUses: parseInt(process.env.DB_POOL_MAX_USES || '50000', 10),
+});
 export const db = drizzle({ client: pool, schema });
@@ -10,13 +10,17 @@ app.use('/api/webhooks/stripe', express.raw({type: 'application/json'}));
 app.use(express.json());
 app.use(express.urlencoded({ extended: false }));
 
+// Deployment info is fixed for the life of the process, so resolve it once at
+// startup. The fallbacks then stay stable across requests too, which keeps the
+// asset ETag below from changing on every hit.
+const deployTimestamp = process.env.DEPLOY_TIMESTAMP || new Date().toISOString();
+const gitCommit = process.env.GIT_COMMIT || 'unknown';
+const cacheBust = process.env.CACHE_BUST || Date.now().toString();
+const assetETag = `"${gitCommit}-${cacheBust}"`;
+
 // Add cache-busting and deployment info headers
 app.use((req, res, next) => {
   // Add deployment tracking headers
-  const deployTimestamp = process.env.DEPLOY_TIMESTAMP || new Date().toISOString();
-  const gitCommit = process.env.GIT_COMMIT || 'unknown';
-  const cacheBust = process.env.CACHE_BUST || Date.now().toString();
-
   res.setHeader('X-Deploy-Timestamp', deployTimestamp);
   res.setHeader('X-Git-Commit', gitCommit);
   res.setHeader('X-Cache-Bust', cacheBust);
@@ -31,22 +35,28 @@ app.use((req, res, next) => {
   // Allow caching for static assets but with validation
   if (req.path.includes('/assets/') || req.path.endsWith('.js') || req.path.endsWith('.css')) {
     res.setHeader('Cache-Control', 'public, max-age=3600, must-revalidate');
-    res.setHeader('ETag', `"${gitCommit}-${cacheBust}"`);
+    res.setHeader('ETag', assetETag);
   }
 
   next();
 });
 
+// Logging response bodies means serializing every JSON payload a second time
+// just to print its first few characters; only do that in development.
+const logResponseBodies = process.env.NODE_ENV === "development";
+
 app.use((req, res, next) => {
   const start = Date.now();
   const path = req.path;
   let capturedJsonResponse: Record<string, any> | undefined = undefined;
 
-  const originalResJson = res.json;
-  res.json = function (bodyJson, ...args) {
-    capturedJsonResponse = bodyJson;
-    return originalResJson.apply(res, [bodyJson, ...args]);
-  };
+  if (logResponseBodies) {
+    const originalResJson = res.json;
+    res.json = function (bodyJson, ...args) {
+      capturedJsonResponse = bodyJson;
+      return originalResJson.apply(res, [bodyJson, ...args]);
+    };
+  }
 
   res.on("finish", () => {
     const duration = Date.now() - start;
@@ -500,8 +500,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
         });
       }
 
-      const usageSummary = await subscriptionService.getAllUserUsage(userId);
-      const subscriptionWithPlan = await subscriptionService.getUserSubscriptionWithPlan(userId);
+      const { usage: usageSummary, subscription: subscriptionWithPlan } =
+        await subscriptionService.getAllUserUsage(userId);
       
       res.json({
         usage: usageSummary,
@@ -855,14 +855,18 @@ export async function registerRoutes(app: Express): Promise<Server> {
         existingCode: project?.files as Record<string, string> || {}
       };
       
-      // Stream generation with progress updates
+      // Stream generation with progress updates. Progress is reported per
+      // token but plateaus at 90 for the rest of the stream, so persist it
+      // only when it changes instead of issuing a write per token.
+      let lastPersistedProgress: number | undefined;
       const streamGenerator = generateCodeStreamFromPrompt(
         data.prompt, 
         context, 
         async (update: StreamingUpdate) => {
           res.write(`data: ${JSON.stringify(update)}\n\n`);
           
-          if (update.progress) {
+          if (update.progress && update.progress !== lastPersistedProgress) {
+            lastPersistedProgress = update.progress;
             await storage.updateCodeGeneration(generation.id, {
               progress: update.progress,
               status: update.type === 'complete' ? 'completed' : 'streaming'
@@ -2544,29 +2548,35 @@ export async function registerRoutes(app: Express): Promise<Server> {
     try {
       const userId = getUserId(req);
       
-      const integrations = await storage.getUserIntegrations(userId);
+      const healthCounts = await storage.getIntegrationHealthCounts(userId);
       
-      // Calculate real health overview
-      const totalIntegrations = integrations.length;
-      const healthyIntegrations = integrations.filter(i => i.healthCheck?.status === 'healthy').length;
-      const degradedIntegrations = integrations.filter(i => i.healthCheck?.status === 'degraded').length;
-      const unhealthyIntegrations = integrations.filter(i => i.healthCheck?.status === 'unhealthy').length;
+      // Calculate real health overview from the grouped counts
+      let totalIntegrations = 0;
+      let healthyIntegrations = 0;
+      let degradedIntegrations = 0;
+      let unhealthyIntegrations = 0;
       
       // Group by type
-      const integrationsByType = integrations.reduce((acc, integration) => {
-        const type = integration.type || 'api';
-        if (!acc[type]) acc[type] = { total: 0, healthy: 0 };
-        acc[type].total++;
-        if (integration.healthCheck?.status === 'healthy') {
-          acc[type].healthy++;
-        }
-        return acc;
-      }, {
+      const integrationsByType: Record<string, { total: number; healthy: number }> = {
         'cloud-provider': { total: 0, healthy: 0 },
         'repository': { total: 0, healthy: 0 },
         'api': { total: 0, healthy: 0 },
         'communication': { total: 0, healthy: 0 }
-      });
+      };
+      
+      for (const { type: integrationType, status, count } of healthCounts) {
+        totalIntegrations += count;
+        if (status === 'healthy') healthyIntegrations += count;
+        else if (status === 'degraded') degradedIntegrations += count;
+        else if (status === 'unhealthy') unhealthyIntegrations += count;
+        
+        const type = integrationType || 'api';
+        if (!integrationsByType[type]) integrationsByType[type] = { total: 0, healthy: 0 };
+        integrationsByType[type].total += count;
+        if (status === 'healthy') {
+          integrationsByType[type].healthy += count;
+        }
+      }
       
       const healthOverview = {
         totalIntegrations,
@@ -3824,7 +3834,7 @@ test('renders learn react link', () => {
     try {
       const userId = (req as any).user.id;
       const agents = await db
-        .select()
+        .select({ id: projects.id, name: projects.name })
         .from(projects)
         .where(eq(projects.userId, userId));
 
@@ -3901,10 +3911,9 @@ test('renders learn react link', () => {
       // Store integration and secrets
       const integration = await storage.createIntegration(integrationData.integration);
 
-      for (const secret of integrationData.secrets) {
-        secret.integrationId = integration.id;
-        await storage.createIntegrationSecret(secret);
-      }
+      await storage.createIntegrationSecrets(
+        integrationData.secrets.map(secret => ({ ...secret, integrationId: integration.id }))
+      );
 
       res.json({
         success: true,
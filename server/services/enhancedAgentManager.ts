@@ -1088,16 +1088,18 @@ Based on the context and your role as a ${agent.type} agent, make an intelligent
 
     // Check for pending tasks that might need sub-agent delegation
     const pendingTasks = await storage.getAgentTasks(agentId);
+    const now = Date.now();
+    const runningFor = (task: typeof pendingTasks[number]) =>
+      now - new Date(task.startedAt || task.createdAt).getTime();
     const stuckTasks = pendingTasks.filter(task =>
-      task.status === 'running' &&
-      new Date().getTime() - new Date(task.startedAt || task.createdAt).getTime() > 10 * 60 * 1000
+      task.status === 'running' && runningFor(task) > 10 * 60 * 1000
     );
 
     for (const task of stuckTasks) {
       // Consider creating a sub-agent to help with stuck tasks
       const decision = await this.makeIntelligentDecision(agentId, {
         stuckTask: task,
-        duration: new Date().getTime() - new Date(task.startedAt || task.createdAt).getTime()
+        duration: runningFor(task)
       }, [
         { action: "create-helper-sub-agent", description: "Create specialized sub-agent to assist" },
         { action: "retry-task", description: "Retry the task with current agent" },
@@ -12,6 +12,12 @@ import {
 } from '@shared/schema';
 import { randomBytes } from 'crypto';
 
+// Connection-test latency is measured on the monotonic clock so wall-clock
+// adjustments can't produce negative or skewed response times
+function elapsedMs(startTime: number): number {
+  return Math.round(performance.now() - startTime);
+}
+
 export interface ConnectionTestResult {
   success: boolean;
   status: 'connected' | 'failed' | 'timeout' | 'unauthorized' | 'rate_limited';
@@ -321,7 +327,7 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string = 'production'
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       switch (integration.service) {
@@ -348,7 +354,7 @@ export class IntegrationService {
       return {
         success: false,
         status: 'failed',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message,
         recommendations: ['Check connection credentials and network connectivity']
       };
@@ -545,7 +551,7 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       // Get GitHub API token from secrets
@@ -570,7 +576,7 @@ export class IntegrationService {
         signal: AbortSignal.timeout(30000)
       });
 
-      const responseTime = Date.now() - startTime;
+      const responseTime = elapsedMs(startTime);
 
       if (response.ok) {
         const userData = await response.json();
@@ -602,7 +608,7 @@ export class IntegrationService {
       return {
         success: false,
         status: 'timeout',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message,
         recommendations: ['Check network connectivity', 'Verify GitHub API endpoint']
       };
@@ -613,7 +619,7 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       const tokenSecret = integration.secrets?.find(s => s.secretName === 'access_token');
@@ -636,7 +642,7 @@ export class IntegrationService {
         signal: AbortSignal.timeout(30000)
       });
 
-      const responseTime = Date.now() - startTime;
+      const responseTime = elapsedMs(startTime);
 
       if (response.ok) {
         const userData = await response.json();
@@ -663,7 +669,7 @@ export class IntegrationService {
       return {
         success: false,
         status: 'timeout',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message
       };
     }
@@ -673,7 +679,7 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       const keySecret = integration.secrets?.find(s => s.secretName === 'secret_key');
@@ -695,7 +701,7 @@ export class IntegrationService {
         signal: AbortSignal.timeout(30000)
       });
 
-      const responseTime = Date.now() - startTime;
+      const responseTime = elapsedMs(startTime);
 
       if (response.ok) {
         const accountData = await response.json();
@@ -724,7 +730,7 @@ export class IntegrationService {
       return {
         success: false,
         status: 'timeout',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message
       };
     }
@@ -734,7 +740,7 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       const sidSecret = integration.secrets?.find(s => s.secretName === 'account_sid');
@@ -761,7 +767,7 @@ export class IntegrationService {
         signal: AbortSignal.timeout(30000)
       });
 
-      const responseTime = Date.now() - startTime;
+      const responseTime = elapsedMs(startTime);
 
       if (response.ok) {
         const accountData = await response.json();
@@ -789,7 +795,7 @@ export class IntegrationService {
       return {
         success: false,
         status: 'timeout',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message
       };
     }
@@ -799,7 +805,7 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       const keySecret = integration.secrets?.find(s => s.secretName === 'api_key');
@@ -821,7 +827,7 @@ export class IntegrationService {
         signal: AbortSignal.timeout(30000)
       });
 
-      const responseTime = Date.now() - startTime;
+      const responseTime = elapsedMs(startTime);
 
       if (response.ok) {
         const accountData = await response.json();
@@ -848,7 +854,7 @@ export class IntegrationService {
       return {
         success: false,
         status: 'timeout',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message
       };
     }
@@ -858,7 +864,7 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       const accessKeySecret = integration.secrets?.find(s => s.secretName === 'access_key_id');
@@ -877,7 +883,7 @@ export class IntegrationService {
       return {
         success: true,
         status: 'connected',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         details: {
           provider: 'AWS',
           region: integration.configuration?.region || 'us-east-1'
@@ -888,7 +894,7 @@ export class IntegrationService {
       return {
         success: false,
         status: 'failed',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message
       };
     }
@@ -898,14 +904,14 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       // Azure connection test implementation
       return {
         success: true,
         status: 'connected',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         details: {
           provider: 'Azure'
         }
@@ -914,7 +920,7 @@ export class IntegrationService {
       return {
         success: false,
         status: 'failed',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message
       };
     }
@@ -924,14 +930,14 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       // GCP connection test implementation
       return {
         success: true,
         status: 'connected',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         details: {
           provider: 'Google Cloud Platform'
         }
@@ -940,7 +946,7 @@ export class IntegrationService {
       return {
         success: false,
         status: 'failed',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message
       };
     }
@@ -950,7 +956,7 @@ export class IntegrationService {
     integration: Integration & { secrets?: IntegrationSecret[] },
     environment: string
   ): Promise<ConnectionTestResult> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       const baseUrl = integration.endpoints?.api;
@@ -969,14 +975,14 @@ export class IntegrationService {
       return {
         success: response.ok,
         status: response.ok ? 'connected' : 'failed',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         statusCode: response.status
       };
     } catch (error) {
       return {
         success: false,
         status: 'timeout',
-        responseTime: Date.now() - startTime,
+        responseTime: elapsedMs(startTime),
         errorMessage: error.message
       };
     }
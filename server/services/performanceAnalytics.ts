@@ -669,11 +669,18 @@ Respond in JSON format:
 
     if (rumMetrics.length === 0) return bottlenecks;
 
-    // Calculate average Core Web Vitals
-    const avgLcp = rumMetrics.reduce((sum, m) => sum + (m.largestContentfulPaint || 0), 0) / rumMetrics.length;
-    const avgFid = rumMetrics.reduce((sum, m) => sum + (m.firstInputDelay || 0), 0) / rumMetrics.length;
-    const avgCls = rumMetrics.reduce((sum, m) => sum + (m.cumulativeLayoutShift ? parseFloat(m.cumulativeLayoutShift) : 0), 0) / rumMetrics.length;
-    const avgTti = rumMetrics.reduce((sum, m) => sum + (m.timeToInteractive || 0), 0) / rumMetrics.length;
+    // Calculate average Core Web Vitals in a single pass
+    let sumLcp = 0, sumFid = 0, sumCls = 0, sumTti = 0;
+    for (const m of rumMetrics) {
+      sumLcp += m.largestContentfulPaint || 0;
+      sumFid += m.firstInputDelay || 0;
+      sumCls += m.cumulativeLayoutShift ? parseFloat(m.cumulativeLayoutShift) : 0;
+      sumTti += m.timeToInteractive || 0;
+    }
+    const avgLcp = sumLcp / rumMetrics.length;
+    const avgFid = sumFid / rumMetrics.length;
+    const avgCls = sumCls / rumMetrics.length;
+    const avgTti = sumTti / rumMetrics.length;
 
     // Check LCP (Largest Contentful Paint)
     if (avgLcp > 2500) { // Poor LCP threshold
@@ -1155,15 +1162,17 @@ Make insights actionable and specific to the data provided.`;
   private calculateTrend(metrics: TimeSeriesMetric[]): any {
     if (metrics.length < 2) return { direction: 'stable', strength: 0 };
     
-    const values = metrics.map(m => parseFloat(m.value.toString()));
-    const timestamps = metrics.map(m => new Date(m.timestamp).getTime());
-    
-    // Simple linear regression for trend
-    const n = values.length;
-    const sumX = timestamps.reduce((a, b) => a + b, 0);
-    const sumY = values.reduce((a, b) => a + b, 0);
-    const sumXY = timestamps.reduce((sum, x, i) => sum + x * values[i], 0);
-    const sumXX = timestamps.reduce((sum, x) => sum + x * x, 0);
+    // Simple linear regression for trend, accumulated in one pass
+    const n = metrics.length;
+    let sumX = 0, sumY = 0, sumXY = 0, sumXX = 0;
+    for (const m of metrics) {
+      const x = new Date(m.timestamp).getTime();
+      const y = parseFloat(m.value.toString());
+      sumX += x;
+      sumY += y;
+      sumXY += x * y;
+      sumXX += x * x;
+    }
     
     const slope = (n * sumXY - sumX * sumY) / (n * sumXX - sumX * sumX);
     
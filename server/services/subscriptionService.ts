@@ -4,10 +4,21 @@
 import Stripe from "stripe";
 import { 
   users,
-  type User
+  subscriptionPlans,
+  userSubscriptions,
+  usageTracking,
+  billingHistory,
+  type User,
+  type SubscriptionPlan,
+  type UserSubscription,
+  type InsertUserSubscription,
+  type UsageTracking,
+  type InsertUsageTracking,
+  type BillingHistory,
+  type InsertBillingHistory
 } from "@shared/schema";
 import { db } from "../db";
-import { eq, and, desc, gte, lte, isNull, or } from "drizzle-orm";
+import { eq, and, desc, isNull, or, sql } from "drizzle-orm";
 
 // Initialize Stripe (from javascript_stripe blueprint)
 // Make Stripe optional to allow app to run without credentials
@@ -36,7 +47,61 @@ export interface SubscriptionServiceError {
   details?: any;
 }
 
+// Default limits per plan, overridden by the plan row's own limits
+const DEFAULT_PLAN_LIMITS: { [key: string]: PlanLimits } = {
+  free: {
+    projects: 1,
+    aiGenerations: 5,
+    storageGB: 1,
+    collaborators: 0,
+    apiCalls: 100
+  },
+  starter: {
+    projects: 5,
+    aiGenerations: 50,
+    storageGB: 5,
+    collaborators: 2,
+    apiCalls: 1000
+  },
+  professional: {
+    projects: -1, // unlimited
+    aiGenerations: -1, // unlimited
+    storageGB: 100,
+    collaborators: 10,
+    apiCalls: 10000
+  },
+  enterprise: {
+    projects: -1, // unlimited
+    aiGenerations: -1, // unlimited
+    storageGB: 1000,
+    collaborators: -1, // unlimited
+    apiCalls: 100000
+  }
+};
+
+// Plans are seeded by migration and change rarely, but are read on every
+// usage check; cache them in-process for a short TTL.
+const PLAN_CACHE_TTL_MS = 2 * 60 * 1000;
+
 export class SubscriptionService {
+  private planCache = new Map<string, { value: unknown; expiresAt: number }>();
+
+  private async getCachedPlan<T>(key: string, load: () => Promise<T>): Promise<T> {
+    const now = Date.now();
+    const entry = this.planCache.get(key);
+    if (entry && entry.expiresAt > now) {
+      // Each key is only ever filled by the loader of the matching method
+      return entry.value as T;
+    }
+
+    const value = await load();
+    // Don't cache misses (including an empty plan list) so a newly seeded
+    // plan is visible immediately
+    if (Array.isArray(value) ? value.length > 0 : value != null) {
+      this.planCache.set(key, { value, expiresAt: now + PLAN_CACHE_TTL_MS });
+    }
+    return value;
+  }
   
   // Helper method to check if Stripe is available
   private ensureStripeAvailable(): Stripe {
@@ -52,11 +117,11 @@ export class SubscriptionService {
   
   async getActivePlans(): Promise<SubscriptionPlan[]> {
     try {
-      return await db
+      return await this.getCachedPlan('active', () => db
         .select()
         .from(subscriptionPlans)
         .where(eq(subscriptionPlans.isActive, true))
-        .orderBy(subscriptionPlans.sortOrder, subscriptionPlans.monthlyPrice);
+        .orderBy(subscriptionPlans.sortOrder, subscriptionPlans.monthlyPrice));
     } catch (error) {
       throw new Error(`Failed to get active plans: ${error.message}`);
     }
@@ -64,13 +129,15 @@ export class SubscriptionService {
 
   async getPlanById(planId: string): Promise<SubscriptionPlan | null> {
     try {
-      const plans = await db
-        .select()
-        .from(subscriptionPlans)
-        .where(eq(subscriptionPlans.id, planId))
-        .limit(1);
-      
-      return plans[0] || null;
+      return await this.getCachedPlan(`id:${planId}`, async () => {
+        const plans = await db
+          .select()
+          .from(subscriptionPlans)
+          .where(eq(subscriptionPlans.id, planId))
+          .limit(1);
+
+        return plans[0] || null;
+      });
     } catch (error) {
       throw new Error(`Failed to get plan: ${error.message}`);
     }
@@ -78,13 +145,15 @@ export class SubscriptionService {
 
   async getPlanByName(planName: string): Promise<SubscriptionPlan | null> {
     try {
-      const plans = await db
-        .select()
-        .from(subscriptionPlans)
-        .where(eq(subscriptionPlans.name, planName))
-        .limit(1);
-      
-      return plans[0] || null;
+      return await this.getCachedPlan(`name:${planName}`, async () => {
+        const plans = await db
+          .select()
+          .from(subscriptionPlans)
+          .where(eq(subscriptionPlans.name, planName))
+          .limit(1);
+
+        return plans[0] || null;
+      });
     } catch (error) {
       throw new Error(`Failed to get plan by name: ${error.message}`);
     }
@@ -93,39 +162,7 @@ export class SubscriptionService {
   getPlanLimits(plan: SubscriptionPlan): PlanLimits {
     const limits = plan.limits as PlanLimits || {};
     
-    // Default limits based on plan
-    const defaultLimits: { [key: string]: PlanLimits } = {
-      free: {
-        projects: 1,
-        aiGenerations: 5,
-        storageGB: 1,
-        collaborators: 0,
-        apiCalls: 100
-      },
-      starter: {
-        projects: 5,
-        aiGenerations: 50,
-        storageGB: 5,
-        collaborators: 2,
-        apiCalls: 1000
-      },
-      professional: {
-        projects: -1, // unlimited
-        aiGenerations: -1, // unlimited
-        storageGB: 100,
-        collaborators: 10,
-        apiCalls: 10000
-      },
-      enterprise: {
-        projects: -1, // unlimited
-        aiGenerations: -1, // unlimited
-        storageGB: 1000,
-        collaborators: -1, // unlimited
-        apiCalls: 100000
-      }
-    };
-
-    return { ...defaultLimits[plan.name] || defaultLimits.free, ...limits };
+    return { ...DEFAULT_PLAN_LIMITS[plan.name] || DEFAULT_PLAN_LIMITS.free, ...limits };
   }
 
   // =====================================================
@@ -232,8 +269,8 @@ export class SubscriptionService {
     try {
       const now = new Date();
       const startOfMonth = new Date(now.getFullYear(), now.getMonth(), 1);
-      const endOfMonth = new Date(now.getFullYear(), now.getMonth() + 1, 0);
 
+      // The period is identified by its start, matching what incrementUsage writes
       const usage = await db
         .select()
         .from(usageTracking)
@@ -241,10 +278,8 @@ export class SubscriptionService {
           eq(usageTracking.userId, userId),
           eq(usageTracking.metricType, metricType),
           eq(usageTracking.period, 'current_month'),
-          gte(usageTracking.periodStart, startOfMonth),
-          lte(usageTracking.periodEnd, endOfMonth)
+          eq(usageTracking.periodStart, startOfMonth)
         ))
-        .orderBy(desc(usageTracking.createdAt))
         .limit(1);
       
       return usage[0] || null;
@@ -259,42 +294,35 @@ export class SubscriptionService {
       const startOfMonth = new Date(now.getFullYear(), now.getMonth(), 1);
       const endOfMonth = new Date(now.getFullYear(), now.getMonth() + 1, 0, 23, 59, 59, 999);
 
-      // Get or create current usage record
-      let usage = await this.getCurrentUsage(userId, metricType);
-      
-      if (!usage) {
-        // Create new usage record
-        const usageData: InsertUsageTracking = {
-          userId,
-          metricType,
-          metricValue: increment,
-          period: 'current_month',
-          periodStart: startOfMonth,
-          periodEnd: endOfMonth,
-          resetAt: endOfMonth,
-          lastIncrement: now
-        };
+      const usageData: InsertUsageTracking = {
+        userId,
+        metricType,
+        metricValue: increment,
+        period: 'current_month',
+        periodStart: startOfMonth,
+        periodEnd: endOfMonth,
+        resetAt: endOfMonth,
+        lastIncrement: now
+      };
 
-        const newUsage = await db
-          .insert(usageTracking)
-          .values(usageData)
-          .returning();
-        
-        return newUsage[0];
-      } else {
-        // Update existing usage record
-        const updatedUsage = await db
-          .update(usageTracking)
-          .set({
-            metricValue: usage.metricValue + increment,
+      // Upsert on the (user, metric, period, periodStart) unique index: the
+      // first request of a period inserts the row, later ones add to it in
+      // SQL. One round trip, and concurrent requests can neither lose
+      // increments nor create duplicate rows.
+      const [usage] = await db
+        .insert(usageTracking)
+        .values(usageData)
+        .onConflictDoUpdate({
+          target: [usageTracking.userId, usageTracking.metricType, usageTracking.period, usageTracking.periodStart],
+          set: {
+            metricValue: sql`${usageTracking.metricValue} + ${increment}`,
             lastIncrement: now,
             updatedAt: now
-          })
-          .where(eq(usageTracking.id, usage.id))
-          .returning();
-        
-        return updatedUsage[0];
-      }
+          }
+        })
+        .returning();
+
+      return usage;
     } catch (error) {
       throw new Error(`Failed to increment usage: ${error.message}`);
     }
@@ -302,8 +330,12 @@ export class SubscriptionService {
 
   async checkUsageLimit(userId: string, metricType: string): Promise<{ allowed: boolean; usage: number; limit: number; plan: string }> {
     try {
-      // Get user's current subscription and plan
-      const subscriptionWithPlan = await this.getUserSubscriptionWithPlan(userId);
+      // Subscription and usage lookups are independent, so run them together
+      const [subscriptionWithPlan, usage] = await Promise.all([
+        this.getUserSubscriptionWithPlan(userId),
+        this.getCurrentUsage(userId, metricType)
+      ]);
+      const currentUsage = usage?.metricValue || 0;
       
       if (!subscriptionWithPlan) {
         // No subscription, use free plan limits
@@ -311,8 +343,6 @@ export class SubscriptionService {
         if (!freePlan) throw new Error('Free plan not found');
         
         const limits = this.getPlanLimits(freePlan);
-        const usage = await this.getCurrentUsage(userId, metricType);
-        const currentUsage = usage?.metricValue || 0;
         const limit = limits[metricType] || 0;
         
         return {
@@ -325,8 +355,6 @@ export class SubscriptionService {
 
       // Get plan limits
       const limits = this.getPlanLimits(subscriptionWithPlan.plan);
-      const usage = await this.getCurrentUsage(userId, metricType);
-      const currentUsage = usage?.metricValue || 0;
       const limit = limits[metricType] || 0;
 
       return {
@@ -340,25 +368,30 @@ export class SubscriptionService {
     }
   }
 
-  async getAllUserUsage(userId: string): Promise<{ [key: string]: { usage: number; limit: number } }> {
+  // Returns the subscription the limits were resolved from alongside the usage,
+  // so callers that also report the plan don't look it up a second time
+  async getAllUserUsage(userId: string): Promise<{
+    usage: { [key: string]: { usage: number; limit: number } };
+    subscription: (UserSubscription & { plan: SubscriptionPlan }) | null;
+  }> {
     try {
       const now = new Date();
       const startOfMonth = new Date(now.getFullYear(), now.getMonth(), 1);
-      const endOfMonth = new Date(now.getFullYear(), now.getMonth() + 1, 0);
 
-      // Get all current month usage
-      const usageRecords = await db
-        .select()
-        .from(usageTracking)
-        .where(and(
-          eq(usageTracking.userId, userId),
-          eq(usageTracking.period, 'current_month'),
-          gte(usageTracking.periodStart, startOfMonth),
-          lte(usageTracking.periodEnd, endOfMonth)
-        ));
+      // Usage and subscription lookups are independent, so run them together
+      const [usageRecords, subscriptionWithPlan] = await Promise.all([
+        db
+          .select()
+          .from(usageTracking)
+          .where(and(
+            eq(usageTracking.userId, userId),
+            eq(usageTracking.period, 'current_month'),
+            eq(usageTracking.periodStart, startOfMonth)
+          )),
+        this.getUserSubscriptionWithPlan(userId)
+      ]);
 
       // Get user's plan limits
-      const subscriptionWithPlan = await this.getUserSubscriptionWithPlan(userId);
       const plan = subscriptionWithPlan?.plan || await this.getPlanByName('free');
       if (!plan) throw new Error('No plan found');
       
@@ -382,7 +415,7 @@ export class SubscriptionService {
         }
       });
 
-      return usageSummary;
+      return { usage: usageSummary, subscription: subscriptionWithPlan };
     } catch (error) {
       throw new Error(`Failed to get all user usage: ${error.message}`);
     }
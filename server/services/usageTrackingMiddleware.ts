@@ -34,6 +34,14 @@ function isOwnerWhitelisted(email: string): boolean {
   return OWNER_WHITELIST.includes(email.toLowerCase());
 }
 
+// Plan hierarchy (higher number = more features)
+const PLAN_HIERARCHY: Record<string, number> = {
+  'free': 0,
+  'starter': 1,
+  'professional': 2,
+  'enterprise': 3
+};
+
 // Generic usage tracking middleware factory
 export function createUsageTrackingMiddleware(options: UsageCheckOptions) {
   return async (req: UsageCheckRequest, res: Response, next: NextFunction) => {
@@ -202,16 +210,8 @@ export function planFeatureMiddleware(requiredPlan: string, featureName: string)
       const subscriptionWithPlan = await subscriptionService.getUserSubscriptionWithPlan(userId);
       const currentPlan = subscriptionWithPlan?.plan?.name || 'free';
 
-      // Define plan hierarchy (higher number = more features)
-      const planHierarchy: Record<string, number> = {
-        'free': 0,
-        'starter': 1,
-        'professional': 2,
-        'enterprise': 3
-      };
-
-      const currentPlanLevel = planHierarchy[currentPlan] || 0;
-      const requiredPlanLevel = planHierarchy[requiredPlan] || 999;
+      const currentPlanLevel = PLAN_HIERARCHY[currentPlan] || 0;
+      const requiredPlanLevel = PLAN_HIERARCHY[requiredPlan] || 999;
 
       if (currentPlanLevel < requiredPlanLevel) {
         return res.status(403).json({
@@ -261,9 +261,9 @@ export function usageSummaryMiddleware(req: UsageCheckRequest, res: Response, ne
       const userId = req.user?.claims?.sub || req.user?.id;
       
       if (userId) {
-        // Get comprehensive usage summary
-        const usageSummary = await subscriptionService.getAllUserUsage(userId);
-        const subscriptionWithPlan = await subscriptionService.getUserSubscriptionWithPlan(userId);
+        // Get comprehensive usage summary and the subscription it was based on
+        const { usage: usageSummary, subscription: subscriptionWithPlan } =
+          await subscriptionService.getAllUserUsage(userId);
         
         const responseData = {
           ...data,
@@ -1,6 +1,7 @@
 import { Router } from 'express';
 import { z } from 'zod';
 import OpenAI from 'openai';
+import { createHash } from 'crypto';
 import { isAuthenticated } from '../../azureAuth.js';
 
 const router = Router();
@@ -61,6 +62,46 @@ const AGENT_PERSONALITIES = {
   }
 };
 
+// Recent agent replies, keyed per user by method + params. An identical
+// request within the TTL is answered without another model call.
+const REPLY_CACHE_TTL_MS = 10 * 60 * 1000;
+const REPLY_CACHE_MAX_ENTRIES = 500;
+const replyCache = new Map<string, { value: any; expiresAt: number }>();
+
+function replyCacheKey(userId: string, method: string, params: any): string {
+  return createHash('sha256').update(JSON.stringify([userId, method, params])).digest('hex');
+}
+
+function getCachedReply(key: string): any {
+  const entry = replyCache.get(key);
+  if (!entry) return undefined;
+  if (entry.expiresAt <= Date.now()) {
+    replyCache.delete(key);
+    return undefined;
+  }
+  return entry.value;
+}
+
+function setCachedReply(key: string, value: any): void {
+  // Map preserves insertion order, so the first key is the oldest entry
+  if (replyCache.size >= REPLY_CACHE_MAX_ENTRIES) {
+    const oldest = replyCache.keys().next();
+    if (!oldest.done) {
+      replyCache.delete(oldest.value);
+    }
+  }
+  replyCache.set(key, { value, expiresAt: Date.now() + REPLY_CACHE_TTL_MS });
+}
+
+// A2A method dispatch table
+const A2A_HANDLERS = new Map<string, (params: any) => Promise<any>>([
+  ['task.analyze', handleTaskAnalysis],
+  ['code.generate', handleCodeGeneration],
+  ['system.design', handleSystemDesign],
+  ['security.audit', handleSecurityAudit],
+  ['deploy.setup', handleDeploySetup]
+]);
+
 // A2A Protocol Message Router
 router.post('/message', isAuthenticated, async (req, res) => {
   try {
@@ -69,27 +110,25 @@ router.post('/message', isAuthenticated, async (req, res) => {
 
     console.log(`A2A Message: ${method} -> ${params.targetAgent}`);
 
+    const user = req.user as any;
+    const cacheKey = replyCacheKey(user?.claims?.sub || user?.id, method, params);
+    let response = getCachedReply(cacheKey);
+    if (response !== undefined) {
+      return res.json({
+        jsonrpc: '2.0',
+        result: response,
+        id
+      });
+    }
+
     // Route to appropriate handler
-    let response;
-    switch (method) {
-      case 'task.analyze':
-        response = await handleTaskAnalysis(params);
-        break;
-      case 'code.generate':
-        response = await handleCodeGeneration(params);
-        break;
-      case 'system.design':
-        response = await handleSystemDesign(params);
-        break;
-      case 'security.audit':
-        response = await handleSecurityAudit(params);
-        break;
-      case 'deploy.setup':
-        response = await handleDeploySetup(params);
-        break;
-      default:
-        throw new Error(`Unknown method: ${method}`);
+    const handler = A2A_HANDLERS.get(method);
+    if (!handler) {
+      throw new Error(`Unknown method: ${method}`);
     }
+    response = await handler(params);
+
+    setCachedReply(cacheKey, response);
 
     res.json({
       jsonrpc: '2.0',
@@ -335,9 +374,9 @@ async function handleDeploySetup(params: any) {
   };
 }
 
-// Get Agent Status
-router.get('/status', isAuthenticated, async (req, res) => {
-  const agents = [
+// Static agent roster and A2A discovery document, serialized once at load
+const AGENT_STATUS_BODY = JSON.stringify({
+  agents: [
     {
       id: 'cara',
       name: 'Cara',
@@ -378,36 +417,35 @@ router.get('/status', isAuthenticated, async (req, res) => {
       status: 'idle',
       capabilities: ['CI/CD', 'Cloud Deployment', 'Infrastructure', 'Monitoring']
     }
-  ];
+  ]
+});
 
-  res.json({ agents });
+const AGENT_DISCOVERY_BODY = JSON.stringify({
+  name: 'Careerate Agent Swarm',
+  version: '1.0.0',
+  protocol: 'A2A/1.0',
+  description: 'AI agent swarm for software development with Cara as orchestrator',
+  capabilities: Array.from(A2A_HANDLERS.keys()),
+  agents: Object.keys(AGENT_PERSONALITIES).map(id => ({
+    id,
+    name: AGENT_PERSONALITIES[id].name,
+    role: AGENT_PERSONALITIES[id].role,
+    capabilities: ['analyze', 'execute', 'collaborate']
+  })),
+  endpoints: {
+    message: '/api/agents/message',
+    status: '/api/agents/status'
+  }
+});
+
+// Get Agent Status
+router.get('/status', isAuthenticated, (req, res) => {
+  res.type('application/json').send(AGENT_STATUS_BODY);
 });
 
 // Agent Discovery (A2A Protocol)
 router.get('/.well-known/agent.json', (req, res) => {
-  res.json({
-    name: 'Careerate Agent Swarm',
-    version: '1.0.0',
-    protocol: 'A2A/1.0',
-    description: 'AI agent swarm for software development with Cara as orchestrator',
-    capabilities: [
-      'task.analyze',
-      'code.generate',
-      'system.design',
-      'security.audit',
-      'deploy.setup'
-    ],
-    agents: Object.keys(AGENT_PERSONALITIES).map(id => ({
-      id,
-      name: AGENT_PERSONALITIES[id].name,
-      role: AGENT_PERSONALITIES[id].role,
-      capabilities: ['analyze', 'execute', 'collaborate']
-    })),
-    endpoints: {
-      message: '/api/agents/message',
-      status: '/api/agents/status'
-    }
-  });
+  res.type('application/json').send(AGENT_DISCOVERY_BODY);
 });
 
 export default router;
\ No newline at end of file
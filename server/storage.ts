@@ -166,6 +166,37 @@ export interface RecentActivity {
 import { db } from "./db";
 import { eq, desc, and, or, sql } from "drizzle-orm";
 
+// Named prepared statements for the hottest point lookups (auth and project
+// ownership checks). Postgres parses and plans them once per connection
+// instead of on every request.
+const getUserById = db
+  .select()
+  .from(users)
+  .where(eq(users.id, sql.placeholder("id")))
+  .prepare("get_user_by_id");
+
+const getProjectById = db
+  .select()
+  .from(projects)
+  .where(eq(projects.id, sql.placeholder("id")))
+  .prepare("get_project_by_id");
+
+// A single statement shape for every filter combination: unset filters bind
+// NULL and their guard short-circuits, so the plan is prepared once rather
+// than once per combination of optional filters.
+const getUserIntegrationsFiltered = db
+  .select()
+  .from(integrations)
+  .where(and(
+    eq(integrations.userId, sql.placeholder("userId")),
+    sql`(${sql.placeholder("projectId")}::varchar IS NULL OR ${integrations.projectId} = ${sql.placeholder("projectId")})`,
+    sql`(${sql.placeholder("type")}::text IS NULL OR ${integrations.type} = ${sql.placeholder("type")})`,
+    sql`(${sql.placeholder("service")}::text IS NULL OR ${integrations.service} = ${sql.placeholder("service")})`,
+    sql`(${sql.placeholder("status")}::text IS NULL OR ${integrations.status} = ${sql.placeholder("status")})`
+  ))
+  .orderBy(desc(integrations.createdAt))
+  .prepare("get_user_integrations_filtered");
+
 export interface IStorage {
   // User operations (required for Replit Auth)
   getUser(id: string): Promise<User | undefined>;
@@ -408,6 +439,7 @@ export interface IStorage {
     status?: string;
   }): Promise<Integration[]>;
   getProjectIntegrations(projectId: string): Promise<Integration[]>;
+  getIntegrationHealthCounts(userId: string): Promise<{ type: string; status: string | null; count: number }[]>;
   updateIntegration(id: string, updates: Partial<Integration>): Promise<Integration | undefined>;
   deleteIntegration(id: string): Promise<boolean>;
   getIntegrationsByService(service: string): Promise<Integration[]>;
@@ -415,6 +447,7 @@ export interface IStorage {
 
   // Integration Secrets operations
   createIntegrationSecret(secret: InsertIntegrationSecret): Promise<IntegrationSecret>;
+  createIntegrationSecrets(secrets: InsertIntegrationSecret[]): Promise<IntegrationSecret[]>;
   getIntegrationSecret(id: string): Promise<IntegrationSecret | undefined>;
   getIntegrationSecrets(integrationId: string): Promise<IntegrationSecret[]>;
   updateIntegrationSecret(id: string, updates: Partial<IntegrationSecret>): Promise<IntegrationSecret | undefined>;
@@ -617,7 +650,7 @@ export interface IStorage {
 export class DatabaseStorage implements IStorage {
   // User operations (required for Replit Auth)
   async getUser(id: string): Promise<User | undefined> {
-    const [user] = await db.select().from(users).where(eq(users.id, id));
+    const [user] = await getUserById.execute({ id });
     return user;
   }
 
@@ -717,7 +750,7 @@ export class DatabaseStorage implements IStorage {
 
   // Project operations
   async getProject(id: string): Promise<Project | undefined> {
-    const [project] = await db.select().from(projects).where(eq(projects.id, id));
+    const [project] = await getProjectById.execute({ id });
     return project;
   }
 
@@ -1816,24 +1849,28 @@ export class DatabaseStorage implements IStorage {
     service?: string;
     status?: string;
   }): Promise<Integration[]> {
-    const conditions = [eq(integrations.userId, userId)];
-    
-    if (filters?.projectId) {
-      conditions.push(eq(integrations.projectId, filters.projectId));
-    }
-    if (filters?.type) {
-      conditions.push(eq(integrations.type, filters.type));
-    }
-    if (filters?.service) {
-      conditions.push(eq(integrations.service, filters.service));
-    }
-    if (filters?.status) {
-      conditions.push(eq(integrations.status, filters.status));
-    }
-
-    return await db.select().from(integrations)
-      .where(and(...conditions))
-      .orderBy(desc(integrations.createdAt));
+    return await getUserIntegrationsFiltered.execute({
+      userId,
+      projectId: filters?.projectId || null,
+      type: filters?.type || null,
+      service: filters?.service || null,
+      status: filters?.status || null,
+    });
+  }
+
+  // Per-(type, health status) counts aggregated in SQL, so overview callers
+  // don't have to load every integration row just to count them
+  async getIntegrationHealthCounts(userId: string): Promise<{ type: string; status: string | null; count: number }[]> {
+    const healthStatus = sql<string | null>`${integrations.healthCheck}->>'status'`;
+    return await db
+      .select({
+        type: integrations.type,
+        status: healthStatus,
+        count: sql<number>`count(*)::int`,
+      })
+      .from(integrations)
+      .where(eq(integrations.userId, userId))
+      .groupBy(integrations.type, healthStatus);
   }
 
   async getProjectIntegrations(projectId: string): Promise<Integration[]> {
@@ -1880,6 +1917,17 @@ export class DatabaseStorage implements IStorage {
     return newSecret;
   }
 
+  // Multi-row insert so callers storing several secrets pay a single round trip
+  async createIntegrationSecrets(secrets: InsertIntegrationSecret[]): Promise<IntegrationSecret[]> {
+    if (secrets.length === 0) {
+      return [];
+    }
+    return await db
+      .insert(integrationSecrets)
+      .values(secrets)
+      .returning();
+  }
+
   async getIntegrationSecret(id: string): Promise<IntegrationSecret | undefined> {
     const [secret] = await db.select().from(integrationSecrets)
       .where(eq(integrationSecrets.id, id));
@@ -2080,21 +2128,21 @@ export class DatabaseStorage implements IStorage {
   async getIntegrationAuditLogs(integrationId: string, limit: number = 100): Promise<IntegrationAuditLog[]> {
     return await db.select().from(integrationAuditLogs)
       .where(eq(integrationAuditLogs.integrationId, integrationId))
-      .orderBy(desc(integrationAuditLogs.createdAt))
+      .orderBy(desc(integrationAuditLogs.timestamp))
       .limit(limit);
   }
 
   async getUserAuditLogs(userId: string, limit: number = 100): Promise<IntegrationAuditLog[]> {
     return await db.select().from(integrationAuditLogs)
       .where(eq(integrationAuditLogs.userId, userId))
-      .orderBy(desc(integrationAuditLogs.createdAt))
+      .orderBy(desc(integrationAuditLogs.timestamp))
       .limit(limit);
   }
 
   async getAuditLogsByAction(action: string, limit: number = 100): Promise<IntegrationAuditLog[]> {
     return await db.select().from(integrationAuditLogs)
       .where(eq(integrationAuditLogs.action, action))
-      .orderBy(desc(integrationAuditLogs.createdAt))
+      .orderBy(desc(integrationAuditLogs.timestamp))
       .limit(limit);
   }
 
@@ -2794,12 +2842,93 @@ export class DatabaseStorage implements IStorage {
   async getRecentActivity(userId: string, limit: number = 10): Promise<RecentActivity[]> {
     const activities: RecentActivity[] = [];
 
-    // Get recent projects
-    const recentProjects = await db.select()
-      .from(projects)
-      .where(eq(projects.userId, userId))
-      .orderBy(desc(projects.createdAt))
-      .limit(5);
+    // These reads are independent, so issue them concurrently rather than
+    // paying five sequential round trips on the dashboard path
+    const [
+      recentProjects,
+      recentCodeGenerations,
+      recentIntegrations,
+      recentRepositories,
+      recentAgentTasks
+    ] = await Promise.all([
+      // Get recent projects
+      db.select({
+        id: projects.id,
+        name: projects.name,
+        framework: projects.framework,
+        createdAt: projects.createdAt
+      })
+        .from(projects)
+        .where(eq(projects.userId, userId))
+        .orderBy(desc(projects.createdAt))
+        .limit(5),
+
+      // Get recent code generations
+      db.select({
+        id: codeGenerations.id,
+        projectId: codeGenerations.projectId,
+        prompt: codeGenerations.prompt,
+        status: codeGenerations.status,
+        createdAt: codeGenerations.createdAt,
+        projectName: projects.name
+      })
+        .from(codeGenerations)
+        .leftJoin(projects, eq(codeGenerations.projectId, projects.id))
+        .where(eq(codeGenerations.userId, userId))
+        .orderBy(desc(codeGenerations.createdAt))
+        .limit(5),
+
+      // Get recent integrations
+      db.select({
+        id: integrations.id,
+        name: integrations.name,
+        service: integrations.service,
+        projectId: integrations.projectId,
+        createdAt: integrations.createdAt,
+        projectName: projects.name
+      })
+        .from(integrations)
+        .leftJoin(projects, eq(integrations.projectId, projects.id))
+        .where(eq(integrations.userId, userId))
+        .orderBy(desc(integrations.createdAt))
+        .limit(3),
+
+      // Get recent repository connections
+      db.select({
+        id: repositoryConnections.id,
+        repositoryName: repositoryConnections.repositoryName,
+        provider: repositoryConnections.provider,
+        projectId: repositoryConnections.projectId,
+        createdAt: repositoryConnections.createdAt,
+        projectName: projects.name
+      })
+        .from(repositoryConnections)
+        .leftJoin(integrations, eq(repositoryConnections.integrationId, integrations.id))
+        .leftJoin(projects, eq(repositoryConnections.projectId, projects.id))
+        .where(eq(integrations.userId, userId))
+        .orderBy(desc(repositoryConnections.createdAt))
+        .limit(3),
+
+      // Get recent completed agent tasks
+      db.select({
+        id: agentTasks.id,
+        description: agentTasks.description,
+        taskType: agentTasks.taskType,
+        status: agentTasks.status,
+        projectId: agentTasks.projectId,
+        completedAt: agentTasks.completedAt,
+        projectName: projects.name
+      })
+        .from(agentTasks)
+        .leftJoin(projects, eq(agentTasks.projectId, projects.id))
+        .leftJoin(aiAgents, eq(agentTasks.agentId, aiAgents.id))
+        .where(and(
+          eq(projects.userId, userId),
+          eq(agentTasks.status, 'completed')
+        ))
+        .orderBy(desc(agentTasks.completedAt))
+        .limit(3)
+    ]);
 
     for (const project of recentProjects) {
       activities.push({
@@ -2814,21 +2943,6 @@ export class DatabaseStorage implements IStorage {
       });
     }
 
-    // Get recent code generations
-    const recentCodeGenerations = await db.select({
-      id: codeGenerations.id,
-      projectId: codeGenerations.projectId,
-      prompt: codeGenerations.prompt,
-      status: codeGenerations.status,
-      createdAt: codeGenerations.createdAt,
-      projectName: projects.name
-    })
-      .from(codeGenerations)
-      .leftJoin(projects, eq(codeGenerations.projectId, projects.id))
-      .where(eq(codeGenerations.userId, userId))
-      .orderBy(desc(codeGenerations.createdAt))
-      .limit(5);
-
     for (const generation of recentCodeGenerations) {
       activities.push({
         id: `code_${generation.id}`,
@@ -2842,21 +2956,6 @@ export class DatabaseStorage implements IStorage {
       });
     }
 
-    // Get recent integrations
-    const recentIntegrations = await db.select({
-      id: integrations.id,
-      name: integrations.name,
-      service: integrations.service,
-      projectId: integrations.projectId,
-      createdAt: integrations.createdAt,
-      projectName: projects.name
-    })
-      .from(integrations)
-      .leftJoin(projects, eq(integrations.projectId, projects.id))
-      .where(eq(integrations.userId, userId))
-      .orderBy(desc(integrations.createdAt))
-      .limit(3);
-
     for (const integration of recentIntegrations) {
       activities.push({
         id: `integration_${integration.id}`,
@@ -2870,22 +2969,6 @@ export class DatabaseStorage implements IStorage {
       });
     }
 
-    // Get recent repository connections
-    const recentRepositories = await db.select({
-      id: repositoryConnections.id,
-      repositoryName: repositoryConnections.repositoryName,
-      provider: repositoryConnections.provider,
-      projectId: repositoryConnections.projectId,
-      createdAt: repositoryConnections.createdAt,
-      projectName: projects.name
-    })
-      .from(repositoryConnections)
-      .leftJoin(integrations, eq(repositoryConnections.integrationId, integrations.id))
-      .leftJoin(projects, eq(repositoryConnections.projectId, projects.id))
-      .where(eq(integrations.userId, userId))
-      .orderBy(desc(repositoryConnections.createdAt))
-      .limit(3);
-
     for (const repo of recentRepositories) {
       activities.push({
         id: `repo_${repo.id}`,
@@ -2899,26 +2982,6 @@ export class DatabaseStorage implements IStorage {
       });
     }
 
-    // Get recent completed agent tasks
-    const recentAgentTasks = await db.select({
-      id: agentTasks.id,
-      description: agentTasks.description,
-      taskType: agentTasks.taskType,
-      status: agentTasks.status,
-      projectId: agentTasks.projectId,
-      completedAt: agentTasks.completedAt,
-      projectName: projects.name
-    })
-      .from(agentTasks)
-      .leftJoin(projects, eq(agentTasks.projectId, projects.id))
-      .leftJoin(aiAgents, eq(agentTasks.agentId, aiAgents.id))
-      .where(and(
-        eq(projects.userId, userId),
-        eq(agentTasks.status, 'completed')
-      ))
-      .orderBy(desc(agentTasks.completedAt))
-      .limit(3);
-
     for (const task of recentAgentTasks) {
       activities.push({
         id: `agent_task_${task.id}`,
@@ -1,5 +1,5 @@
 import { sql } from "drizzle-orm";
-import { pgTable, text, varchar, timestamp, jsonb, boolean, index, integer, decimal } from "drizzle-orm/pg-core";
+import { pgTable, text, varchar, timestamp, jsonb, boolean, index, uniqueIndex, integer, decimal } from "drizzle-orm/pg-core";
 import { relations } from "drizzle-orm";
 import { createInsertSchema } from "drizzle-zod";
 import { z } from "zod";
@@ -440,7 +440,10 @@ export const userSubscriptions = pgTable("user_subscriptions", {
   metadata: jsonb("metadata").default({}),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
-});
+}, (table) => [
+  // Active subscription lookup: user + status, newest first
+  index("idx_user_subscriptions_user_status_created").on(table.userId, table.status, table.createdAt.desc()),
+]);
 
 export const usageTracking = pgTable("usage_tracking", {
   id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
@@ -458,7 +461,10 @@ export const usageTracking = pgTable("usage_tracking", {
   metadata: jsonb("metadata").default({}),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
-});
+}, (table) => [
+  // One counter row per user, metric and period; also the upsert conflict target
+  uniqueIndex("idx_usage_tracking_user_metric_period").on(table.userId, table.metricType, table.period, table.periodStart),
+]);
 
 export const billingHistory = pgTable("billing_history", {
   id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),